@@ -1,125 +1,165 @@
 from __future__ import annotations
 
-import json
+import array
 import random
-from abc import ABC, abstractmethod
+import sys
 from enum import Enum, auto
-from typing import Optional
+from typing import Any, Iterable, Optional, TextIO, cast
 from dataclasses import dataclass
 
+# orjson is optional; it parses large graph files several times faster
+try:
+    from orjson import loads as _json_loads  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment, unused-ignore]
+
+# Log file handle, opened once by main() and shared by every log_event call
+_log_file: Optional[TextIO] = None
+# Bytes of log output buffered between write syscalls
+LOG_BUFFER_SIZE = 1 << 16
+
+
 # Logging utility
-def log_event(event: str):
-    with open("execution_log.txt", "a") as log_file:
-        log_file.write(event + "\n")
+def log_event(event: str) -> None:
+    if _log_file is not None:
+        _log_file.write(event + "\n")
 
 # --- Tiny type for Role IDs ---
-@dataclass(frozen=True)
+# create_nodes makes exactly one RoleId per role, so equality and hashing
+# can fall back to identity, and index locates the role in the registry
+@dataclass(frozen=True, slots=True, eq=False)
 class RoleId:
     value: str
+    index: int
 
     def __str__(self) -> str:
         return self.value
 
 
+# Log lines read the plain _name_ attribute: Enum .name goes through a
+# descriptor and costs an order of magnitude more per message
 class MessageType(Enum):
     ECHO = auto()
     ACK = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     type: MessageType
-    content: str
     sender_id: RoleId
     receiver_id: RoleId
 
 
 # TaskQueue to store messages
 class TaskQueue:
-    def __init__(self):
-        self._queue = []
+    # Number of random picks drawn from the PRNG at a time
+    RANDOM_BATCH = 1024
+
+    def __init__(self) -> None:
+        self._queue: list[Message] = []
+        self._random_picks = array.array("Q")
 
-    def enqueue(self, message: Message):
+    def enqueue(self, message: Message) -> None:
         log_event(
-            f"Enqueued message {message.type.name} from {message.sender_id} to {message.receiver_id}"
+            f"Enqueued message {message.type._name_} from {message.sender_id} to {message.receiver_id}"
         )
         self._queue.append(message)
 
     def dequeue(self) -> Optional[Message]:
-        if not self._queue:
+        queue = self._queue
+        if not queue:
             return None
-        return self._queue.pop(random.randrange(len(self._queue)))
+        # Swap the picked message with the last one so the pop is O(1).
+        i = self._next_random() % len(queue)
+        queue[i], queue[-1] = queue[-1], queue[i]
+        return queue.pop()
 
     def has_tasks(self) -> bool:
         return bool(self._queue)
 
+    def _next_random(self) -> int:
+        # One randbytes call refills a whole batch of 64-bit picks
+        picks = self._random_picks
+        if not picks:
+            picks.frombytes(random.randbytes(picks.itemsize * self.RANDOM_BATCH))
+        return picks.pop()
+
 
 # Communication system
 class CommunicationSystem:
-    def __init__(self, queue: TaskQueue, role_registry: dict[RoleId, Role]):
+    def __init__(self, queue: TaskQueue, role_registry: list[Role]) -> None:
         self.queue = queue
-        self.roles = role_registry  # maps RoleId -> Role
+        self.dequeue = queue.dequeue
+        self.roles = role_registry  # indexed by RoleId.index
+        self.pending_nodes = 0  # roles that have not finished yet
 
-    def send(self, message: Message):
-        log_event(
-            f"Communication: Sending {message.type.name} from {message.sender_id} to {message.receiver_id}"
-        )
-        self.queue.enqueue(message)
+    def mark_terminated(self) -> None:
+        self.pending_nodes -= 1
 
-    def execute_one(self):
+    def execute_one(self) -> None:
         """Process a single queued message if available."""
-        message = self.queue.dequeue()
+        message = self.dequeue()
         if message:
-            receiver = self.roles[message.receiver_id]
-            sender = self.roles[message.sender_id]
+            roles = self.roles
+            receiver = roles[message.receiver_id.index]
+            sender = roles[message.sender_id.index]
             receiver.receive(message, sender)
 
 
-# Abstract Role class
-class Role(ABC):
-    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem):
+# Base Role class
+class Role:
+    __slots__ = ("role_id", "neighbor_ids", "communication", "enqueue")
+
+    is_initiator = False
+
+    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem) -> None:
         self.role_id = role_id
-        self.neighbor_ids = neighbors
+        # Duplicate neighbor entries collapse, keeping first-seen order
+        self.neighbor_ids = tuple(dict.fromkeys(neighbors))
         self.communication = communication
+        # Messages go straight onto the task queue
+        self.enqueue = communication.queue.enqueue
 
-    @abstractmethod
-    def send(self, message_type: MessageType, addressees: list[RoleId]):
-        pass
+    def send(self, message_type: MessageType, addressees: Iterable[RoleId]) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def receive(self, message: Message, sender: Optional[Role]):
-        pass
+    def receive(self, message: Message, sender: Role) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
     def is_terminated(self) -> bool:
-        pass
+        raise NotImplementedError
 
 
 # Initiator role
 class Initiator(Role):
-    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem):
+    __slots__ = ("received_acks",)
+
+    is_initiator = True
+
+    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem) -> None:
         super().__init__(role_id, neighbors, communication)
         self.received_acks = 0
 
-    def send(self, message_type: MessageType, addressees: list[RoleId]):
+    def send(self, message_type: MessageType, addressees: Iterable[RoleId]) -> None:
         for neighbor_id in addressees:
-            self.communication.send(
-                Message(message_type, message_type.name, self.role_id, neighbor_id)
-            )
+            self.enqueue(Message(message_type, self.role_id, neighbor_id))
 
-    def receive(self, message: Message, sender: Optional[Role]):
-        log_event(f"Node {self.role_id} received '{message.type.name}' from {sender.role_id}")
-        if message.type == MessageType.ACK:
+    def receive(self, message: Message, sender: Role) -> None:
+        log_event(f"Node {self.role_id} received '{message.type._name_}' from {sender.role_id}")
+        if message.type is MessageType.ACK:
             self.handle_ack()
 
-    def handle_ack(self):
+    def handle_ack(self) -> None:
         self.received_acks += 1
         if self.is_terminated():
             log_event(f"Node {self.role_id}: Echo complete.")
             log_event(f"Node {self.role_id}: Algorithm finished.")
+            self.communication.mark_terminated()
 
-    def start(self):
+    def start(self) -> None:
         self.send(MessageType.ECHO, self.neighbor_ids)
+        if self.is_terminated():
+            self.communication.mark_terminated()
 
     def is_terminated(self) -> bool:
         return self.received_acks == len(self.neighbor_ids)
@@ -127,74 +167,86 @@ class Initiator(Role):
 
 # Participant role
 class Participant(Role):
-    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem):
+    __slots__ = ("parent_id", "received", "received_acks", "children", "_expected_acks")
+
+    def __init__(self, role_id: RoleId, neighbors: list[RoleId], communication: CommunicationSystem) -> None:
         super().__init__(role_id, neighbors, communication)
         self.parent_id: Optional[RoleId] = None
         self.received = False
         self.received_acks = 0
+        self.children: tuple[RoleId, ...] = ()
+        self._expected_acks = 0
 
-    def send(self, message_type: MessageType, addressees: list[RoleId]):
+    def send(self, message_type: MessageType, addressees: Iterable[RoleId]) -> None:
+        # Addressees are the children, so the parent is already excluded
         for neighbor_id in addressees:
-            if neighbor_id != self.parent_id:
-                self.communication.send(
-                    Message(message_type, message_type.name, self.role_id, neighbor_id)
-                )
-
-    def receive(self, message: Message, sender: Optional[Role]):
-        log_event(f"Node {self.role_id} received '{message.type.name}' from {sender.role_id}")
-        if message.type == MessageType.ECHO:
+            self.enqueue(Message(message_type, self.role_id, neighbor_id))
+
+    def receive(self, message: Message, sender: Role) -> None:
+        log_event(f"Node {self.role_id} received '{message.type._name_}' from {sender.role_id}")
+        if message.type is MessageType.ECHO:
             self.handle_echo(sender.role_id)
-        elif message.type == MessageType.ACK:
+        elif message.type is MessageType.ACK:
             self.handle_ack()
 
-    def handle_echo(self, sender_id: RoleId):
+    def handle_echo(self, sender_id: RoleId) -> None:
         if not self.received:
             self.received = True
             self.parent_id = sender_id
-            children = [n for n in self.neighbor_ids if n != self.parent_id]
-            if children:
-                self.send(MessageType.ECHO, children)
+            # Keep graph order so a seeded run delivers messages reproducibly
+            self.children = tuple(n for n in self.neighbor_ids if n is not self.parent_id)
+            self._expected_acks = len(self.children)
+            if self.children:
+                self.send(MessageType.ECHO, self.children)
             else:
                 self.finish()
 
-    def handle_ack(self):
+    def handle_ack(self) -> None:
         self.received_acks += 1
         if self.received_acks == self.expected_acks():
             self.finish()
 
     def expected_acks(self) -> int:
-        return len([n for n in self.neighbor_ids if n != self.parent_id])
+        return self._expected_acks
 
-    def finish(self):
+    def finish(self) -> None:
         log_event(f"Node {self.role_id}: Echo complete.")
         if self.parent_id:
-            self.communication.send(
-                Message(MessageType.ACK, MessageType.ACK.name, self.role_id, self.parent_id)
-            )
+            self.enqueue(Message(MessageType.ACK, self.role_id, self.parent_id))
         log_event(f"Node {self.role_id}: Algorithm finished.")
+        self.communication.mark_terminated()
 
     def is_terminated(self) -> bool:
         return self.received and self.received_acks == self.expected_acks()
 
 
 # Load graph from file
-def load_graph(filename: str) -> dict:
-    with open(filename, "r") as f:
-        return json.load(f)
+def load_graph(filename: str) -> dict[str, dict[str, Any]]:
+    with open(filename, "rb") as f:
+        graph_data: dict[str, dict[str, Any]] = _json_loads(f.read())
+    return graph_data
 
 
 # Create node instances
 def create_nodes(
-    graph_data: dict[str, dict], communication: CommunicationSystem
-) -> dict[RoleId, Role]:
-    temp_nodes: dict[RoleId, Role] = {}
+    graph_data: dict[str, dict[str, Any]], communication: CommunicationSystem
+) -> list[Role]:
+    # Intern one RoleId per role so every reference shares it
+    role_ids = {
+        role_name: RoleId(role_name, index)
+        for index, role_name in enumerate(graph_data)
+    }
+    temp_nodes: list[Role] = []
 
     for role_name, info in graph_data.items():
-        role_id = RoleId(role_name)
-        neighbors = [RoleId(n) for n in info.get("neighbors", [])]
+        role_id = role_ids[role_name]
+        try:
+            neighbors = [role_ids[n] for n in info.get("neighbors", [])]
+        except KeyError as e:
+            raise ValueError(f"Node {role_name} has unknown neighbor {e.args[0]}") from None
         role_type = info.get("role", "participant")
 
-        temp_nodes[role_id] = (
+        temp_nodes.append(
             Initiator(role_id, neighbors, communication)
             if role_type == "initiator"
             else Participant(role_id, neighbors, communication)
@@ -204,28 +256,46 @@ def create_nodes(
 
 
 # Main function
-def main(graph_file="graph.json"):
-    with open("execution_log.txt", "w") as log_file:
-        log_file.write("Execution Log:\n")
-
+def main(graph_file: str = "graph.json") -> bool:
+    global _log_file
+    try:
+        with open("execution_log.txt", "w", buffering=LOG_BUFFER_SIZE) as _log_file:
+            _log_file.write("Execution Log:\n")
+            return run(graph_file)
+    finally:
+        _log_file = None
+
+
+# Run the echo algorithm on the given graph; returns whether every role finished
+def run(graph_file: str) -> bool:
     graph_data = load_graph(graph_file)
     task_queue = TaskQueue()
 
     # Pass role registry later after creation
-    nodes: dict[RoleId, Role] = {}
+    nodes: list[Role] = []
     communication = CommunicationSystem(task_queue, nodes)
-    nodes.update(create_nodes(graph_data, communication))
+    nodes.extend(create_nodes(graph_data, communication))
+    communication.pending_nodes = len(nodes)
 
-    initiator = next((n for n in nodes.values() if isinstance(n, Initiator)), None)
+    initiator = next((n for n in nodes if n.is_initiator), None)
     if not initiator:
         print("No initiator found in the graph.")
-        return
+        return False
 
-    initiator.start()
+    cast(Initiator, initiator).start()
 
-    while not all(n.is_terminated() for n in nodes.values()):
+    # Stop once every role has finished, or when no message is left to
+    # deliver (roles unreachable from the initiator never finish)
+    while communication.pending_nodes and task_queue.has_tasks():
         communication.execute_one()
 
+    if communication.pending_nodes:
+        warning = f"Echo did not terminate: {communication.pending_nodes} node(s) never finished."
+        log_event(warning)
+        print(warning)
+        return False
+    return True
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)